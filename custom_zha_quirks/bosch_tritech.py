@@ -17,7 +17,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from types import MappingProxyType
 from typing import Any
+import weakref
 
 from zigpy.quirks import CustomCluster, CustomDevice
 from zigpy.profiles import zha
@@ -51,18 +53,44 @@ from zhaquirks.const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fallback clock for clusters created before an event loop is running
+_monotonic = time.monotonic
+
 # Motion handling configuration
 MOTION_TIMEOUT_S = 120  # Clear occupancy after this many seconds of no motion
 STUCK_MOTION_THRESHOLD_S = 30  # If occupied longer than this when clear arrives, treat as new motion
 STUCK_WARNING_THRESHOLD_S = 1800  # Warn if occupied for 30+ minutes without new events
+STUCK_CHECK_INTERVAL_S = 300  # Re-check every 5 minutes while occupied
+COMMUNICATION_TIMEOUT_S = 3600  # Warn if no communication for 1+ hour
+INIT_CLEAR_DELAY_S = 5  # Clear restored occupancy this long after startup
+COMMUNICATION_DEBOUNCE_S = 10  # Refresh the last-communication time at most this often
 MOTION_CLEAR_EVENT = "motion_clear"
 COMMUNICATION_EVENT = "device_communication"
 
+# Debug format for every zone status frame, kept at module scope for the hot path
+_ZONE_STATUS_FMT = (
+    "%s: Zone status 0x%04X - motion=%d, tamper=%s, "
+    "low_battery=%s, supervision=%s (msg #%d)"
+)
+
 # Poll control configuration (in quarter-seconds)
 CHECKIN_INTERVAL = 3600  # 15 minutes (3600 quarter-seconds) - more aggressive than default
+CHECKIN_INTERVAL_MIN = CHECKIN_INTERVAL // 240  # Same interval in minutes, for logging
 FAST_POLL_TIMEOUT = 40  # 10 seconds of fast polling after check-in
 
 
+def _weak_method(method):
+    """Wrap a bound method so a pending timer does not keep its cluster alive."""
+    ref = weakref.WeakMethod(method)
+
+    def _call():
+        bound = ref()
+        if bound is not None:
+            bound()
+
+    return _call
+
+
 class BoschPowerConfiguration(PowerConfigurationCluster):
     """Power configuration with voltage-to-percentage conversion for Bosch sensors."""
 
@@ -79,16 +107,24 @@ class BoschPollControl(CustomCluster, PollControl):
 
     cluster_id = PollControl.cluster_id
 
+    __slots__ = ("_occupancy", "_log_prefix")
+
+    def __init__(self, *args, **kwargs):
+        """Initialize with no occupancy cluster wired yet."""
+        super().__init__(*args, **kwargs)
+        self._occupancy = None  # Wired by BoschRFDLZBMS once endpoints exist
+        self._log_prefix = f"Bosch RFDL-ZB-MS [{self.endpoint.device.ieee}]"
+
     async def bind(self):
         """Bind cluster and configure aggressive polling."""
         result = await super().bind()
 
         _LOGGER.info(
-            "Bosch RFDL-ZB-MS [%s]: Configuring poll control - "
+            "%s: Configuring poll control - "
             "check-in interval: %d quarter-sec (%d min), fast poll timeout: %d quarter-sec",
-            self.endpoint.device.ieee,
+            self._log_prefix,
             CHECKIN_INTERVAL,
-            CHECKIN_INTERVAL // 240,
+            CHECKIN_INTERVAL_MIN,
             FAST_POLL_TIMEOUT,
         )
 
@@ -99,13 +135,13 @@ class BoschPollControl(CustomCluster, PollControl):
                 "fast_poll_timeout": FAST_POLL_TIMEOUT,
             })
             _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Poll control configured successfully",
-                self.endpoint.device.ieee,
+                "%s: Poll control configured successfully",
+                self._log_prefix,
             )
         except Exception as e:
             _LOGGER.warning(
-                "Bosch RFDL-ZB-MS [%s]: Failed to configure poll control: %s",
-                self.endpoint.device.ieee,
+                "%s: Failed to configure poll control: %s",
+                self._log_prefix,
                 e,
             )
 
@@ -122,12 +158,16 @@ class BoschPollControl(CustomCluster, PollControl):
         super().handle_cluster_request(hdr, args, dst_addressing=dst_addressing)
 
         if hdr.command_id == 0:  # Check-in command
-            _LOGGER.debug(
-                "Bosch RFDL-ZB-MS [%s]: Device checked in (poll control)",
-                self.endpoint.device.ieee,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Device checked in (poll control)",
+                    self._log_prefix,
+                )
             # Notify that we received communication
-            self.endpoint.device.motion_bus.listener_event(COMMUNICATION_EVENT)
+            if self._occupancy is not None:
+                self._occupancy.device_communication()
+            else:
+                self.endpoint.device.motion_bus.listener_event(COMMUNICATION_EVENT)
 
 
 class BoschIasZone(CustomCluster, IasZone):
@@ -135,11 +175,20 @@ class BoschIasZone(CustomCluster, IasZone):
 
     cluster_id = IasZone.cluster_id
 
+    __slots__ = (
+        "_last_zone_status",
+        "_zone_status_count",
+        "_occupancy",
+        "_log_prefix",
+    )
+
     def __init__(self, *args, **kwargs):
         """Initialize with tracking state."""
         super().__init__(*args, **kwargs)
         self._last_zone_status = None
         self._zone_status_count = 0
+        self._occupancy = None  # Wired by BoschRFDLZBMS once endpoints exist
+        self._log_prefix = f"Bosch RFDL-ZB-MS [{self.endpoint.device.ieee}]"
 
     def handle_cluster_request(
         self,
@@ -151,50 +200,57 @@ class BoschIasZone(CustomCluster, IasZone):
         """Handle zone status change notifications with enhanced logging."""
         super().handle_cluster_request(hdr, args, dst_addressing=dst_addressing)
 
-        if hdr.command_id == 0:  # Zone status change notification
-            zone_status = args[0] if args else 0
-            self._zone_status_count += 1
+        if hdr.command_id != 0:  # Only zone status change notifications matter
+            return
+
+        zone_status = args[0] if args else 0
+        self._zone_status_count += 1
 
-            # Parse zone status bits
-            alarm1 = bool(zone_status & 0x01)  # Motion
-            tamper = bool(zone_status & 0x04)  # Tamper
-            battery_low = bool(zone_status & 0x08)  # Low battery
-            supervision = bool(zone_status & 0x20)  # Supervision reports
+        alarm1 = zone_status & 0x01  # Motion
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Bosch RFDL-ZB-MS [%s]: Zone status 0x%04X - motion=%s, tamper=%s, "
-                "low_battery=%s, supervision=%s (msg #%d)",
-                self.endpoint.device.ieee,
+                _ZONE_STATUS_FMT,
+                self._log_prefix,
                 zone_status,
                 alarm1,
-                tamper,
-                battery_low,
-                supervision,
+                bool(zone_status & 0x04),  # Tamper
+                bool(zone_status & 0x08),  # Low battery
+                bool(zone_status & 0x20),  # Supervision reports
                 self._zone_status_count,
             )
 
-            # Warn on concerning status bits
-            if tamper:
+        # Warn on concerning status bits; one mask test covers the no-fault path
+        if zone_status & 0x0C:
+            if zone_status & 0x04:  # Tamper
                 _LOGGER.warning(
-                    "Bosch RFDL-ZB-MS [%s]: TAMPER ALERT - check device mounting",
-                    self.endpoint.device.ieee,
+                    "%s: TAMPER ALERT - check device mounting",
+                    self._log_prefix,
                 )
-            if battery_low:
+            if zone_status & 0x08:  # Low battery
                 _LOGGER.warning(
-                    "Bosch RFDL-ZB-MS [%s]: LOW BATTERY reported by device",
-                    self.endpoint.device.ieee,
+                    "%s: LOW BATTERY reported by device",
+                    self._log_prefix,
                 )
 
-            self._last_zone_status = zone_status
+        self._last_zone_status = zone_status
 
-            # Notify communication received
-            self.endpoint.device.motion_bus.listener_event(COMMUNICATION_EVENT)
+        occupancy = self._occupancy
+        if occupancy is None:
+            # Not wired to an occupancy cluster; fall back to the motion bus
+            listener_event = self.endpoint.device.motion_bus.listener_event
+            listener_event(COMMUNICATION_EVENT)
+            listener_event(MOTION_EVENT if alarm1 else MOTION_CLEAR_EVENT)
+            return
 
-            # Forward motion events
-            if alarm1:
-                self.endpoint.device.motion_bus.listener_event(MOTION_EVENT)
-            else:
-                self.endpoint.device.motion_bus.listener_event(MOTION_CLEAR_EVENT)
+        # Notify communication received
+        occupancy.device_communication()
+
+        # Forward motion events
+        if alarm1:
+            occupancy.motion_event()
+        else:
+            occupancy.motion_clear()
 
 
 class BoschOccupancy(LocalDataCluster, OccupancySensing):
@@ -209,60 +265,99 @@ class BoschOccupancy(LocalDataCluster, OccupancySensing):
 
     cluster_id = OccupancySensing.cluster_id
 
-    _CONSTANT_ATTRIBUTES = {
+    _CONSTANT_ATTRIBUTES = MappingProxyType({
         0x0010: 0,  # PIR sensor type
-    }
+    })
+
+    __slots__ = (
+        "_current_occupancy",
+        "_loop",
+        "_timer_handle",
+        "_deadline_cb",
+        "_stuck_check_cb",
+        "_init_clear_cb",
+        "_stuck_check_handle",
+        "_deadline",
+        "_occupied_since",
+        "_last_communication",
+        "_last_motion_event",
+        "_motion_event_count",
+        "_clear_event_count",
+        "_communication_count",
+        "_stuck_warnings",
+        "_log_prefix",
+    )
 
     def __init__(self, *args, **kwargs):
         """Initialize cluster with tracking state."""
         super().__init__(*args, **kwargs)
+        # Formatted once; every log line for this device shares it
+        self._log_prefix = f"Bosch RFDL-ZB-MS [{self.endpoint.device.ieee}]"
+        self._current_occupancy = 0
         self._update_attribute(0x0000, 0)  # occupancy = unoccupied
         self.endpoint.device.motion_bus.add_listener(self)
 
         # Timers
+        self._loop = None
         self._timer_handle = None
+        # Timer callbacks only hold weak references, so a dropped device's
+        # clusters can be collected while its handles are still queued
+        self._deadline_cb = _weak_method(self._check_deadline)
+        self._stuck_check_cb = _weak_method(self._check_stuck_state)
+        self._init_clear_cb = _weak_method(self._init_clear)
         self._stuck_check_handle = None
-        self._init_clear_handle = None
 
         # Tracking state
+        self._deadline = None
         self._occupied_since = None
-        self._last_communication = time.monotonic()
         self._last_motion_event = None
         self._motion_event_count = 0
         self._clear_event_count = 0
         self._communication_count = 0
         self._stuck_warnings = 0
 
-        # Start periodic stuck state check
-        self._schedule_stuck_check()
-
-        # Schedule a delayed clear to override HA's state restoration
+        # Schedule a delayed clear to override HA's state restoration; it then
+        # hands its timer over to the stuck state / health check
         self._schedule_init_clear()
+        # Seeded once the loop is cached, from the clock every later timestamp uses
+        self._last_communication = self._now()
 
     def _cancel_timers(self):
         """Cancel all pending timers for clean teardown."""
-        for handle in (self._timer_handle, self._stuck_check_handle, self._init_clear_handle):
+        for handle in (self._timer_handle, self._stuck_check_handle):
             if handle is not None:
                 handle.cancel()
         self._timer_handle = None
         self._stuck_check_handle = None
-        self._init_clear_handle = None
 
-    def _schedule_stuck_check(self):
-        """Schedule periodic check for stuck state."""
+    def _now(self):
+        """Return the event loop's clock, or the monotonic clock before a loop is known."""
+        loop = self._loop
+        return loop.time() if loop is not None else _monotonic()
+
+    def _schedule_stuck_check(self, delay):
+        """Schedule the next stuck state and communication health check."""
         try:
-            loop = asyncio.get_running_loop()
-            self._stuck_check_handle = loop.call_later(300, self._check_stuck_state)
+            loop = self._loop or asyncio.get_running_loop()
+            self._loop = loop
+            self._stuck_check_handle = loop.call_later(delay, self._stuck_check_cb)
         except RuntimeError:
             _LOGGER.debug(
                 "Bosch RFDL-ZB-MS: No running event loop for stuck check scheduling"
             )
 
     def _schedule_init_clear(self):
-        """Schedule a delayed clear to override HA's state restoration."""
+        """Schedule a delayed clear to override HA's state restoration.
+
+        Shares the stuck check's timer slot, so each sensor holds a single
+        health timer from the moment it is created.
+        """
         try:
-            loop = asyncio.get_running_loop()
-            self._init_clear_handle = loop.call_later(5, self._init_clear)
+            loop = self._loop or asyncio.get_running_loop()
+            self._loop = loop
+            self._stuck_check_handle = loop.call_later(
+                INIT_CLEAR_DELAY_S, self._init_clear_cb
+            )
         except RuntimeError:
             _LOGGER.debug(
                 "Bosch RFDL-ZB-MS: No running event loop for init clear scheduling"
@@ -270,77 +365,98 @@ class BoschOccupancy(LocalDataCluster, OccupancySensing):
 
     def _init_clear(self):
         """Clear occupancy on startup if no motion detected."""
-        self._init_clear_handle = None
         # Only clear if we haven't received any motion events since init
         if self._motion_event_count == 0:
             _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Clearing stale occupancy state on startup",
-                self.endpoint.device.ieee,
+                "%s: Clearing stale occupancy state on startup",
+                self._log_prefix,
             )
+            # Always written, even if already 0, to override the restored state
+            self._current_occupancy = 0
             self._update_attribute(0x0000, 0)  # occupancy = unoccupied
             self._occupied_since = None
 
+        # Hand the timer slot over to the health check, which reschedules itself
+        self._check_stuck_state()
+
     def _check_stuck_state(self):
-        """Check if device appears stuck and log warning."""
-        try:
-            now = time.monotonic()
+        """Check if device appears stuck or silent and log warnings.
 
-            # Check if occupied for too long without new motion events
-            if self._occupied_since is not None:
-                occupied_duration = now - self._occupied_since
-                if self._last_motion_event is None:
-                    _LOGGER.warning(
-                        "Bosch RFDL-ZB-MS [%s]: Occupied but no motion event recorded - "
-                        "clearing invalid state",
-                        self.endpoint.device.ieee,
-                    )
-                    self._clear_occupancy()
-                    self._schedule_stuck_check()
-                    return
+        Runs every STUCK_CHECK_INTERVAL_S while occupied; motion_event pulls
+        a far-off check forward when the sensor becomes occupied. Otherwise
+        it only runs when the communication timeout can next expire, so an
+        idle sensor wakes the event loop about once an hour instead of every
+        few minutes.
+        """
+        now = self._now()
+
+        # Check if occupied for too long without new motion events
+        if self._occupied_since is not None:
+            occupied_duration = now - self._occupied_since
+            if self._last_motion_event is None:
+                _LOGGER.warning(
+                    "%s: Occupied but no motion event recorded - "
+                    "clearing invalid state",
+                    self._log_prefix,
+                )
+                self._clear_occupancy()
+            else:
                 time_since_last_motion = now - self._last_motion_event
 
                 if (occupied_duration > STUCK_WARNING_THRESHOLD_S and
                     time_since_last_motion > STUCK_WARNING_THRESHOLD_S):
                     self._stuck_warnings += 1
                     _LOGGER.warning(
-                        "Bosch RFDL-ZB-MS [%s]: STUCK STATE DETECTED - "
+                        "%s: STUCK STATE DETECTED - "
                         "occupied for %d min with no new motion events. "
                         "Consider checking device. (warning #%d)",
-                        self.endpoint.device.ieee,
+                        self._log_prefix,
                         int(occupied_duration / 60),
                         self._stuck_warnings,
                     )
 
-            # Check communication health
-            time_since_comm = now - self._last_communication
-            if time_since_comm > 3600:  # 1 hour without any communication
-                _LOGGER.warning(
-                    "Bosch RFDL-ZB-MS [%s]: NO COMMUNICATION for %d minutes - "
-                    "device may be offline or stuck",
-                    self.endpoint.device.ieee,
-                    int(time_since_comm / 60),
-                )
+        # Check communication health
+        time_since_comm = now - self._last_communication
+        if time_since_comm >= COMMUNICATION_TIMEOUT_S:
+            _LOGGER.warning(
+                "%s: NO COMMUNICATION for %d minutes - "
+                "device may be offline or stuck",
+                self._log_prefix,
+                int(time_since_comm / 60),
+            )
+            next_check = COMMUNICATION_TIMEOUT_S
+        else:
+            # Wake up exactly when the silence could reach the timeout
+            next_check = COMMUNICATION_TIMEOUT_S - time_since_comm
 
-            # Reschedule
-            self._schedule_stuck_check()
+        if self._occupied_since is not None:
+            next_check = min(next_check, STUCK_CHECK_INTERVAL_S)
 
-        except Exception as e:
-            _LOGGER.debug("Stuck check error: %s", e)
-            self._schedule_stuck_check()
+        # Reschedule
+        self._schedule_stuck_check(next_check)
 
     def device_communication(self):
-        """Record that we received any communication from device."""
-        self._last_communication = time.monotonic()
+        """Record that we received any communication from device.
+
+        Every frame is counted, but the timestamp is only consulted by the
+        health check, so it is refreshed at most every COMMUNICATION_DEBOUNCE_S.
+        """
         self._communication_count += 1
-        _LOGGER.debug(
-            "Bosch RFDL-ZB-MS [%s]: Communication received (total: %d)",
-            self.endpoint.device.ieee,
-            self._communication_count,
-        )
+        now = self._now()
+        if now - self._last_communication < COMMUNICATION_DEBOUNCE_S:
+            return
+
+        self._last_communication = now
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Communication received (total: %d)",
+                self._log_prefix,
+                self._communication_count,
+            )
 
     def motion_event(self):
         """Handle motion event - set occupied and start/reset timer."""
-        now = time.monotonic()
+        now = self._now()
         self._motion_event_count += 1
         self._last_motion_event = now
         self._last_communication = now
@@ -349,34 +465,72 @@ class BoschOccupancy(LocalDataCluster, OccupancySensing):
         was_occupied = self._occupied_since is not None
 
         if not was_occupied:
-            _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Motion #%d detected, starting %ds timer",
-                self.endpoint.device.ieee,
-                self._motion_event_count,
-                MOTION_TIMEOUT_S,
-            )
-        else:
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "%s: Motion #%d detected, starting %ds timer",
+                    self._log_prefix,
+                    self._motion_event_count,
+                    MOTION_TIMEOUT_S,
+                )
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Bosch RFDL-ZB-MS [%s]: Motion #%d detected (already occupied), resetting %ds timer",
-                self.endpoint.device.ieee,
+                "%s: Motion #%d detected (already occupied), resetting %ds timer",
+                self._log_prefix,
                 self._motion_event_count,
                 MOTION_TIMEOUT_S,
             )
 
-        self._update_attribute(0x0000, 1)  # occupancy = occupied
+        if self._current_occupancy != 1:
+            self._current_occupancy = 1
+            self._update_attribute(0x0000, 1)  # occupancy = occupied
         self._occupied_since = now
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
         try:
-            loop = asyncio.get_running_loop()
-            self._timer_handle = loop.call_later(MOTION_TIMEOUT_S, self._clear_occupancy)
+            loop = self._loop or asyncio.get_running_loop()
         except RuntimeError:
             _LOGGER.error(
-                "Bosch RFDL-ZB-MS [%s]: No running event loop - cannot schedule clear timer",
-                self.endpoint.device.ieee,
+                "%s: No running event loop - cannot schedule clear timer",
+                self._log_prefix,
             )
+            return
+        self._loop = loop
+
+        # Push the deadline (in loop time) out; a pending timer re-arms itself
+        # when it fires, so retriggers never cancel handles into the loop's heap
+        self._deadline = deadline = loop.time() + MOTION_TIMEOUT_S
+        if self._timer_handle is None:
+            self._timer_handle = loop.call_at(deadline, self._deadline_cb)
+
+        if not was_occupied:
+            # An idle sensor's health check can be up to an hour out, or missing
+            # if the cluster was built without a loop; make sure the occupied
+            # state is checked within STUCK_CHECK_INTERVAL_S
+            stuck_check = self._stuck_check_handle
+            if stuck_check is None:
+                self._schedule_stuck_check(STUCK_CHECK_INTERVAL_S)
+            elif stuck_check.when() - loop.time() > STUCK_CHECK_INTERVAL_S:
+                stuck_check.cancel()
+                self._schedule_stuck_check(STUCK_CHECK_INTERVAL_S)
+
+    def _check_deadline(self):
+        """Clear occupancy if the deadline has passed, otherwise re-arm the timer."""
+        handle = self._timer_handle
+        if handle is None:  # Cancelled by _cancel_timers or _clear_occupancy
+            return
+        self._timer_handle = None
+        deadline = self._deadline
+        if deadline is None:
+            return
+
+        # The deadline only ever moves forward, so comparing it with the time
+        # this handle was armed for avoids reading the clock
+        armed_for = handle.when()
+
+        if deadline <= armed_for:
+            self._clear_occupancy()
+            return
+
+        self._timer_handle = self._loop.call_at(deadline, self._deadline_cb)
 
     def motion_clear(self):
         """Handle clear event from hardware.
@@ -388,57 +542,90 @@ class BoschOccupancy(LocalDataCluster, OccupancySensing):
 
         Clears arriving within the threshold are normal operation and ignored.
         """
+        now = self._now()
         self._clear_event_count += 1
-        self._last_communication = time.monotonic()
+        self._last_communication = now
+        log_info = _LOGGER.isEnabledFor(logging.INFO)
 
         if self._occupied_since is None:
-            _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Clear #%d received while NOT occupied - "
-                "treating as motion (stuck sensor reset)",
-                self.endpoint.device.ieee,
-                self._clear_event_count,
-            )
+            if log_info:
+                _LOGGER.info(
+                    "%s: Clear #%d received while NOT occupied - "
+                    "treating as motion (stuck sensor reset)",
+                    self._log_prefix,
+                    self._clear_event_count,
+                )
             self.motion_event()
             return
 
-        occupied_duration = time.monotonic() - self._occupied_since
+        occupied_duration = now - self._occupied_since
 
         if occupied_duration >= STUCK_MOTION_THRESHOLD_S:
-            _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Clear #%d after %ds (>%ds threshold) - "
-                "treating as new motion (sensor reset)",
-                self.endpoint.device.ieee,
-                self._clear_event_count,
-                int(occupied_duration),
-                STUCK_MOTION_THRESHOLD_S,
-            )
+            if log_info:
+                _LOGGER.info(
+                    "%s: Clear #%d after %ds (>%ds threshold) - "
+                    "treating as new motion (sensor reset)",
+                    self._log_prefix,
+                    self._clear_event_count,
+                    int(occupied_duration),
+                    STUCK_MOTION_THRESHOLD_S,
+                )
             self.motion_event()
-        else:
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Bosch RFDL-ZB-MS [%s]: Clear #%d after %ds - "
+                "%s: Clear #%d after %ds - "
                 "normal clear, timer will handle",
-                self.endpoint.device.ieee,
+                self._log_prefix,
                 self._clear_event_count,
                 int(occupied_duration),
             )
 
     def _clear_occupancy(self):
         """Clear occupancy after timeout."""
-        if self._occupied_since is not None:
-            occupied_duration = time.monotonic() - self._occupied_since
+        if self._occupied_since is not None and _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info(
-                "Bosch RFDL-ZB-MS [%s]: Clearing occupancy after %ds timeout "
+                "%s: Clearing occupancy after %ds timeout "
                 "(was occupied for %ds)",
-                self.endpoint.device.ieee,
+                self._log_prefix,
                 MOTION_TIMEOUT_S,
-                int(occupied_duration),
+                int(self._now() - self._occupied_since),
             )
 
-        self._update_attribute(0x0000, 0)  # occupancy = unoccupied
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+        if self._current_occupancy != 0:
+            self._current_occupancy = 0
+            self._update_attribute(0x0000, 0)  # occupancy = unoccupied
         self._timer_handle = None
+        self._deadline = None
         self._occupied_since = None
 
 
+# Endpoint 1 cluster layouts, built once at import and shared with zigpy
+_SIGNATURE_INPUT_CLUSTERS = (
+    Basic.cluster_id,
+    PowerConfiguration.cluster_id,
+    Identify.cluster_id,
+    PollControl.cluster_id,
+    IlluminanceMeasurement.cluster_id,
+    TemperatureMeasurement.cluster_id,
+    IasZone.cluster_id,
+    Diagnostic.cluster_id,
+)
+_REPLACEMENT_INPUT_CLUSTERS = (
+    Basic.cluster_id,
+    BoschPowerConfiguration,
+    Identify.cluster_id,
+    BoschPollControl,  # Custom poll control with aggressive check-in
+    IlluminanceMeasurement.cluster_id,
+    TemperatureMeasurement.cluster_id,
+    BoschIasZone,  # Enhanced IAS Zone with tracking
+    Diagnostic.cluster_id,
+    BoschOccupancy,  # Virtual occupancy with health monitoring
+)
+_OUTPUT_CLUSTERS = (Ota.cluster_id,)
+
+
 class BoschRFDLZBMS(CustomDevice):
     """Bosch RFDL-ZB-MS RADION TriTech motion sensor.
 
@@ -447,33 +634,25 @@ class BoschRFDLZBMS(CustomDevice):
     """
 
     def __init__(self, *args, **kwargs):
-        """Initialize device with motion bus for inter-cluster communication."""
+        """Initialize device and wire its clusters directly to virtual occupancy."""
         self.motion_bus = Bus()
         super().__init__(*args, **kwargs)
+        endpoint = self.endpoints[1]
+        endpoint.ias_zone._occupancy = endpoint.occupancy
+        endpoint.poll_control._occupancy = endpoint.occupancy
         _LOGGER.info(
             "Bosch RFDL-ZB-MS [%s]: Device initialized with enhanced quirk",
             self.ieee,
         )
 
     signature = {
-        MODELS_INFO: [(BOSCH, "RFDL-ZB-MS")],
+        MODELS_INFO: ((BOSCH, "RFDL-ZB-MS"),),
         ENDPOINTS: {
             1: {
                 PROFILE_ID: zha.PROFILE_ID,
                 DEVICE_TYPE: 0x0402,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    PowerConfiguration.cluster_id,
-                    Identify.cluster_id,
-                    PollControl.cluster_id,
-                    IlluminanceMeasurement.cluster_id,
-                    TemperatureMeasurement.cluster_id,
-                    IasZone.cluster_id,
-                    Diagnostic.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Ota.cluster_id,
-                ],
+                INPUT_CLUSTERS: _SIGNATURE_INPUT_CLUSTERS,
+                OUTPUT_CLUSTERS: _OUTPUT_CLUSTERS,
             }
         },
     }
@@ -483,20 +662,8 @@ class BoschRFDLZBMS(CustomDevice):
             1: {
                 PROFILE_ID: zha.PROFILE_ID,
                 DEVICE_TYPE: 0x0402,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    BoschPowerConfiguration,
-                    Identify.cluster_id,
-                    BoschPollControl,  # Custom poll control with aggressive check-in
-                    IlluminanceMeasurement.cluster_id,
-                    TemperatureMeasurement.cluster_id,
-                    BoschIasZone,  # Enhanced IAS Zone with tracking
-                    Diagnostic.cluster_id,
-                    BoschOccupancy,  # Virtual occupancy with health monitoring
-                ],
-                OUTPUT_CLUSTERS: [
-                    Ota.cluster_id,
-                ],
+                INPUT_CLUSTERS: _REPLACEMENT_INPUT_CLUSTERS,
+                OUTPUT_CLUSTERS: _OUTPUT_CLUSTERS,
             }
         },
     }
@@ -1,5 +1,6 @@
 """Test fixtures for Bosch RFDL-ZB-MS quirk tests."""
 
+import asyncio
 from unittest import mock
 
 import pytest
@@ -40,3 +41,48 @@ def zigpy_device_from_quirk():
         return quirk_cls(app, ieee, nwk, device)
 
     return _create
+
+
+class VirtualClock:
+    """Moves the running loop's clock forward instead of sleeping."""
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._offset = 0.0
+        self._real_time = loop.time
+        loop.time = self.time
+
+    def time(self):
+        return self._real_time() + self._offset
+
+    async def advance(self, seconds):
+        """Advance the clock and let the loop run every timer now due."""
+        self._offset += seconds
+        # Yield until nothing is runnable at the new time, so callbacks that
+        # re-arm for an already-passed time are drained however deep they chain
+        await asyncio.sleep(0)
+        while self._pending():
+            await asyncio.sleep(0)
+
+    def _pending(self):
+        """Whether the loop has ready callbacks or live timers already due."""
+        # The base event loop exposes its queues only as private attributes
+        loop = self._loop
+        if loop._ready:
+            return True
+        now = self.time()
+        return any(
+            not handle.cancelled() and handle.when() <= now
+            for handle in loop._scheduled
+        )
+
+    def close(self):
+        del self._loop.time
+
+
+@pytest.fixture
+async def virtual_clock():
+    """Patch the running event loop with a clock tests can advance."""
+    clock = VirtualClock(asyncio.get_running_loop())
+    yield clock
+    clock.close()
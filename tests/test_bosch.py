@@ -1,15 +1,21 @@
 """Tests for Bosch RFDL-ZB-MS TriTech motion sensor quirk."""
 
 import asyncio
-import time
-from unittest import mock
+import gc
+import weakref
+from collections import deque
+
+import pytest
 
-import custom_zha_quirks.bosch_tritech
 from custom_zha_quirks.bosch_tritech import (
     BoschIasZone,
+    BoschPowerConfiguration,
     BoschOccupancy,
     BoschRFDLZBMS,
+    COMMUNICATION_TIMEOUT_S,
+    INIT_CLEAR_DELAY_S,
     MOTION_TIMEOUT_S,
+    STUCK_CHECK_INTERVAL_S,
     STUCK_MOTION_THRESHOLD_S,
 )
 
@@ -17,14 +23,32 @@ from custom_zha_quirks.bosch_tritech import (
 # Format: frame_ctrl(0x09), seq(0x21), cmd(0x00), zone_status(u16le), ext(u8), zone_id(u8), delay(u16le)
 ZCL_IAS_MOTION_COMMAND = b"\x09\x21\x00\x01\x00\x00\x00\x00\x00"  # alarm1=1 (motion)
 ZCL_IAS_CLEAR_COMMAND = b"\x09\x21\x00\x00\x00\x00\x00\x00\x00"  # alarm1=0 (clear)
+ZCL_IAS_TAMPER_COMMAND = b"\x09\x21\x00\x05\x00\x00\x00\x00\x00"  # alarm1=1, tamper=1
+# ZCL Poll Control Check-in frame: frame_ctrl(0x09), seq(0x22), cmd(0x00)
+ZCL_POLL_CHECKIN_COMMAND = b"\x09\x22\x00"
+
+# Frames are constants, so each is parsed once per cluster type and reused
+_DESERIALIZED_FRAMES = {}
+
+
+def _deserialize(cluster, data):
+    """Return the cached (hdr, args) for a raw ZCL frame sent to cluster."""
+    key = (cluster.cluster_id, data)
+    frame = _DESERIALIZED_FRAMES.get(key)
+    if frame is None:
+        frame = _DESERIALIZED_FRAMES[key] = cluster.deserialize(data)
+    return frame
 
 
 class ClusterListener:
-    """Records attribute updates and cluster commands from a cluster."""
+    """Records the most recent attribute updates and cluster commands from a cluster."""
+
+    __slots__ = ("attribute_updates", "cluster_commands")
 
     def __init__(self, cluster):
-        self.attribute_updates = []
-        self.cluster_commands = []
+        # Bounded so stress tests don't grow memory with every event
+        self.attribute_updates = deque(maxlen=1024)
+        self.cluster_commands = deque(maxlen=1024)
         cluster.add_listener(self)
 
     def attribute_updated(self, attrid, value, *args, **kwargs):
@@ -34,6 +58,30 @@ class ClusterListener:
         self.cluster_commands.append((tsn, command_id, args))
 
 
+@pytest.fixture
+async def device(zigpy_device_from_quirk):
+    """A freshly built quirked device, created inside the test's event loop."""
+    return zigpy_device_from_quirk(BoschRFDLZBMS)
+
+
+@pytest.fixture
+def occupancy(device):
+    """The device's virtual occupancy cluster."""
+    return device.endpoints[1].occupancy
+
+
+@pytest.fixture
+def ias_zone(device):
+    """The device's IAS zone cluster."""
+    return device.endpoints[1].ias_zone
+
+
+@pytest.fixture
+def listener(occupancy):
+    """A ClusterListener attached to the occupancy cluster."""
+    return ClusterListener(occupancy)
+
+
 # ---------------------------------------------------------------------------
 # Device structure tests
 # ---------------------------------------------------------------------------
@@ -53,41 +101,59 @@ def test_signature_structure():
     assert 0x0019 in ep["output_clusters"]  # OTA
 
 
-def test_device_has_motion_bus(zigpy_device_from_quirk):
+async def test_device_has_motion_bus(device):
     """Device initializes with a motion bus for inter-cluster communication."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    assert hasattr(device, "motion_bus")
     assert device.motion_bus is not None
 
 
-def test_replacement_clusters(zigpy_device_from_quirk):
+async def test_replacement_clusters(device):
     """Replacement clusters are correctly applied."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
     ep = device.endpoints[1]
 
     assert isinstance(ep.ias_zone, BoschIasZone)
     assert hasattr(ep, "occupancy")
     assert isinstance(ep.occupancy, BoschOccupancy)
+    assert ep.ias_zone._occupancy is ep.occupancy
+    assert ep.poll_control._occupancy is ep.occupancy
 
 
-def test_occupancy_pir_sensor_type(zigpy_device_from_quirk):
+async def test_occupancy_pir_sensor_type(occupancy):
     """Occupancy cluster reports PIR sensor type."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
     assert occupancy._CONSTANT_ATTRIBUTES.get(0x0010) == 0
 
 
+async def test_occupancy_reads_constant_sensor_type(occupancy):
+    """Reading the sensor type attribute is served from the constant table."""
+    records = await occupancy.read_attributes_raw([0x0010])
+
+    assert records[0][0].value.value == 0
+
+
+async def test_battery_percentage_from_voltage(device):
+    """Battery voltage reports map linearly from 1.9V (0%) to 3.0V (100%)."""
+    power = device.endpoints[1].power
+    assert isinstance(power, BoschPowerConfiguration)
+
+    # Out-of-range readings across the uint8 attribute clamp to 0% / 100%
+    for raw, expected in (
+        (30, 200), (19, 0), (35, 200), (15, 0), (25, 109), (1, 0), (254, 200)
+    ):
+        power._update_attribute(0x0020, raw)
+        assert power._attr_cache[0x0021] == expected
+
+    # 0 and 255 are invalid readings and leave the last percentage alone
+    for raw in (0, 255):
+        power._update_attribute(0x0020, raw)
+        assert power._attr_cache[0x0021] == 200
+
+
 # ---------------------------------------------------------------------------
 # Motion / occupancy behavior tests
 # ---------------------------------------------------------------------------
 
 
-async def test_motion_event_sets_occupancy(zigpy_device_from_quirk):
+async def test_motion_event_sets_occupancy(occupancy, listener):
     """Motion event transitions occupancy from 0 to 1."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
     assert occupancy._attr_cache.get(0x0000, 0) == 0
 
     occupancy.motion_event()
@@ -97,31 +163,20 @@ async def test_motion_event_sets_occupancy(zigpy_device_from_quirk):
     assert occupancy._occupied_since is not None
 
 
-async def test_motion_timeout_clears_occupancy(zigpy_device_from_quirk):
+async def test_motion_timeout_clears_occupancy(occupancy, listener, virtual_clock):
     """Occupancy clears automatically after timeout expires."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
-    with mock.patch.object(
-        custom_zha_quirks.bosch_tritech, "MOTION_TIMEOUT_S", 0.05
-    ):
-        occupancy.motion_event()
-        assert listener.attribute_updates[-1] == (0x0000, 1)
+    occupancy.motion_event()
+    assert listener.attribute_updates[-1] == (0x0000, 1)
 
-        await asyncio.sleep(0.1)
+    await virtual_clock.advance(MOTION_TIMEOUT_S)
 
-        assert listener.attribute_updates[-1] == (0x0000, 0)
-        assert occupancy._occupied_since is None
-        assert occupancy._timer_handle is None
+    assert listener.attribute_updates[-1] == (0x0000, 0)
+    assert occupancy._occupied_since is None
+    assert occupancy._timer_handle is None
 
 
-async def test_clear_when_not_occupied_triggers_motion(zigpy_device_from_quirk):
+async def test_clear_when_not_occupied_triggers_motion(occupancy, listener):
     """Clear event while unoccupied is treated as motion (stuck sensor recovery)."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
     assert occupancy._occupied_since is None
 
     occupancy.motion_clear()
@@ -131,12 +186,8 @@ async def test_clear_when_not_occupied_triggers_motion(zigpy_device_from_quirk):
     assert occupancy._occupied_since is not None
 
 
-async def test_clear_within_threshold_ignored(zigpy_device_from_quirk):
+async def test_clear_within_threshold_ignored(occupancy, listener):
     """Clear arriving within STUCK_MOTION_THRESHOLD_S is normal — timer handles it."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
     occupancy.motion_event()
     assert len(listener.attribute_updates) == 1
 
@@ -147,92 +198,148 @@ async def test_clear_within_threshold_ignored(zigpy_device_from_quirk):
     assert occupancy._clear_event_count == 1
 
 
-async def test_clear_after_threshold_triggers_motion(zigpy_device_from_quirk):
+async def test_clear_after_threshold_triggers_motion(occupancy, listener):
     """Clear arriving after STUCK_MOTION_THRESHOLD_S is a sensor reset — treat as motion."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
     occupancy.motion_event()
     assert len(listener.attribute_updates) == 1
 
     # Simulate time passing beyond threshold (sensor was stuck, now resetting)
-    occupancy._occupied_since = time.monotonic() - STUCK_MOTION_THRESHOLD_S - 1
+    occupancy._occupied_since = occupancy._now() - STUCK_MOTION_THRESHOLD_S - 1
 
     occupancy.motion_clear()
 
-    # Should have triggered new motion (timer reset)
-    assert len(listener.attribute_updates) == 2
-    assert listener.attribute_updates[1] == (0x0000, 1)
+    # Should have triggered new motion (timer reset) without re-reporting
+    # the unchanged occupied state
+    assert len(listener.attribute_updates) == 1
     assert occupancy._motion_event_count == 2
 
 
-async def test_multiple_motion_events_reset_timer(zigpy_device_from_quirk):
-    """Subsequent motion events cancel and restart the clear timer."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    occupancy = device.endpoints[1].occupancy
+async def test_timeout_when_unoccupied_skips_update(occupancy, listener):
+    """Clearing an already unoccupied sensor does not emit an attribute update."""
+    occupancy._clear_occupancy()
 
-    with mock.patch.object(
-        custom_zha_quirks.bosch_tritech, "MOTION_TIMEOUT_S", 0.1
-    ):
-        occupancy.motion_event()
-        first_handle = occupancy._timer_handle
+    assert not listener.attribute_updates
+
+
+async def test_multiple_motion_events_reset_timer(occupancy, virtual_clock):
+    """Subsequent motion events extend the clear deadline without rescheduling."""
+    occupancy.motion_event()
+    first_handle = occupancy._timer_handle
+
+    await virtual_clock.advance(MOTION_TIMEOUT_S / 2)
+
+    occupancy.motion_event()
+    second_handle = occupancy._timer_handle
 
-        await asyncio.sleep(0.05)
+    # Same pending handle; only the deadline moved
+    assert first_handle is second_handle
 
+    # Past the first deadline but short of the second — still occupied
+    await virtual_clock.advance(MOTION_TIMEOUT_S * 0.7)
+    assert occupancy._attr_cache.get(0x0000, 0) == 1
+
+    # Full timeout from second event
+    await virtual_clock.advance(MOTION_TIMEOUT_S / 2)
+    assert occupancy._attr_cache.get(0x0000, 0) == 0
+
+
+async def test_motion_burst_keeps_single_timer(occupancy):
+    """A burst of retriggers only moves the deadline; the timer is never replaced."""
+    occupancy.motion_event()
+    handle = occupancy._timer_handle
+    first_deadline = occupancy._deadline
+
+    for _ in range(50):
         occupancy.motion_event()
-        second_handle = occupancy._timer_handle
 
-        assert first_handle is not second_handle
+    assert occupancy._timer_handle is handle
+    assert not handle.cancelled()
+    assert occupancy._deadline >= first_deadline
 
-        # 0.07s after second event — not yet timed out
-        await asyncio.sleep(0.07)
-        assert occupancy._attr_cache.get(0x0000, 0) == 1
 
-        # Full timeout from second event
-        await asyncio.sleep(0.05)
-        assert occupancy._attr_cache.get(0x0000, 0) == 0
+async def test_repeated_motion_no_duplicate_updates(occupancy, listener):
+    """Retriggers while occupied reset the timer without re-reporting occupancy."""
+    for _ in range(10):
+        occupancy.motion_event()
+
+    assert len(listener.attribute_updates) == 1
+    assert occupancy._motion_event_count == 10
 
 
 # ---------------------------------------------------------------------------
-# IAS Zone → bus → occupancy integration tests
+# IAS Zone → occupancy integration tests
 # ---------------------------------------------------------------------------
 
 
-async def test_ias_zone_forwards_motion_to_bus(zigpy_device_from_quirk):
-    """IAS Zone motion alarm propagates through the bus to set occupancy."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    ias = device.endpoints[1].ias_zone
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
-    hdr, args = ias.deserialize(ZCL_IAS_MOTION_COMMAND)
-    ias.handle_message(hdr, args)
+async def test_ias_zone_forwards_motion_to_bus(ias_zone, occupancy, listener):
+    """IAS Zone motion alarm is forwarded to the occupancy cluster."""
+    hdr, args = _deserialize(ias_zone, ZCL_IAS_MOTION_COMMAND)
+    ias_zone.handle_message(hdr, args)
 
     assert len(listener.attribute_updates) == 1
     assert listener.attribute_updates[0] == (0x0000, 1)
 
 
-async def test_ias_zone_forwards_clear_to_bus(zigpy_device_from_quirk):
-    """IAS Zone clear propagates through bus to occupancy cluster."""
-    device = zigpy_device_from_quirk(BoschRFDLZBMS)
-    ias = device.endpoints[1].ias_zone
-    occupancy = device.endpoints[1].occupancy
-    listener = ClusterListener(occupancy)
-
+async def test_ias_zone_forwards_clear_to_bus(ias_zone, occupancy, listener):
+    """IAS Zone clear is forwarded to the occupancy cluster."""
     # Set occupied first
     occupancy.motion_event()
     initial_count = len(listener.attribute_updates)
 
     # Simulate stuck sensor — occupied beyond threshold
-    occupancy._occupied_since = time.monotonic() - STUCK_MOTION_THRESHOLD_S - 1
+    occupancy._occupied_since = occupancy._now() - STUCK_MOTION_THRESHOLD_S - 1
 
     # Send clear via IAS Zone — should trigger new motion (sensor reset)
-    hdr, args = ias.deserialize(ZCL_IAS_CLEAR_COMMAND)
-    ias.handle_message(hdr, args)
+    hdr, args = _deserialize(ias_zone, ZCL_IAS_CLEAR_COMMAND)
+    ias_zone.handle_message(hdr, args)
 
-    assert len(listener.attribute_updates) == initial_count + 1
+    # Still occupied, so no duplicate attribute report
+    assert len(listener.attribute_updates) == initial_count
     assert occupancy._clear_event_count == 1
+    assert occupancy._motion_event_count == 2
+
+
+async def test_ias_zone_falls_back_to_bus_when_unwired(ias_zone, occupancy, listener):
+    """Without a direct occupancy reference, IAS Zone events go over the motion bus."""
+    ias_zone._occupancy = None
+
+    hdr, args = _deserialize(ias_zone, ZCL_IAS_MOTION_COMMAND)
+    ias_zone.handle_message(hdr, args)
+
+    assert list(listener.attribute_updates) == [(0x0000, 1)]
+    assert occupancy._communication_count == 1
+
+
+async def test_ias_zone_tamper_warns(ias_zone, occupancy, caplog):
+    """Tamper bit logs a warning and motion is still forwarded."""
+    hdr, args = _deserialize(ias_zone, ZCL_IAS_TAMPER_COMMAND)
+    ias_zone.handle_message(hdr, args)
+
+    assert "TAMPER ALERT" in caplog.text
+    assert "LOW BATTERY" not in caplog.text
+    assert occupancy._motion_event_count == 1
+
+
+async def test_poll_checkin_records_communication(device, occupancy):
+    """Poll control check-in is recorded as communication on the occupancy cluster."""
+    poll = device.endpoints[1].poll_control
+
+    hdr, args = _deserialize(poll, ZCL_POLL_CHECKIN_COMMAND)
+    poll.handle_message(hdr, args)
+
+    assert occupancy._communication_count == 1
+
+
+async def test_device_communication_debounced(occupancy):
+    """Bursts of frames are all counted but only refresh the timestamp once."""
+    occupancy._last_communication -= 60
+
+    occupancy.device_communication()
+    refreshed = occupancy._last_communication
+    occupancy.device_communication()
+
+    assert occupancy._communication_count == 2
+    assert occupancy._last_communication == refreshed
 
 
 # ---------------------------------------------------------------------------
@@ -240,16 +347,119 @@ async def test_ias_zone_forwards_clear_to_bus(zigpy_device_from_quirk):
 # ---------------------------------------------------------------------------
 
 
-async def test_cancel_timers(zigpy_device_from_quirk):
-    """_cancel_timers cancels all scheduled callbacks and nulls the handles."""
+async def test_init_clear_hands_timer_to_health_check(zigpy_device_from_quirk):
+    """Startup clear shares the health check timer and re-arms it once done."""
+    device = zigpy_device_from_quirk(BoschRFDLZBMS)
+    occupancy = device.endpoints[1].occupancy
+    listener = ClusterListener(occupancy)
+    loop = asyncio.get_running_loop()
+
+    delay = occupancy._stuck_check_handle.when() - loop.time()
+    assert delay <= INIT_CLEAR_DELAY_S
+
+    occupancy._init_clear()
+
+    # Restored state is overridden even though the cache already holds 0
+    assert list(listener.attribute_updates) == [(0x0000, 0)]
+    delay = occupancy._stuck_check_handle.when() - loop.time()
+    assert delay > INIT_CLEAR_DELAY_S
+
+
+async def test_idle_health_check_waits_for_communication_timeout(occupancy):
+    """An idle sensor's next health check is due when its silence hits the timeout."""
+    loop = asyncio.get_running_loop()
+
+    occupancy._last_communication = loop.time() - 600
+    occupancy._check_stuck_state()
+
+    delay = occupancy._stuck_check_handle.when() - loop.time()
+    assert COMMUNICATION_TIMEOUT_S - 601 < delay <= COMMUNICATION_TIMEOUT_S - 600
+
+    # Motion pulls the pending check within the shorter stuck-check interval
+    occupancy.motion_event()
+
+    delay = occupancy._stuck_check_handle.when() - loop.time()
+    assert delay <= STUCK_CHECK_INTERVAL_S
+
+
+async def test_last_communication_seeded_from_loop_clock(
+    zigpy_device_from_quirk, virtual_clock, caplog
+):
+    """A new sensor starts its silence on the loop clock, not time.monotonic()."""
+    await virtual_clock.advance(COMMUNICATION_TIMEOUT_S)
     device = zigpy_device_from_quirk(BoschRFDLZBMS)
     occupancy = device.endpoints[1].occupancy
 
+    occupancy._check_stuck_state()
+
+    assert "NO COMMUNICATION" not in caplog.text
+
+
+async def test_motion_arms_missing_health_check(zigpy_device_from_quirk):
+    """A sensor built without a running loop gets its health check on first motion."""
+    loop = asyncio.get_running_loop()
+    device = await loop.run_in_executor(None, zigpy_device_from_quirk, BoschRFDLZBMS)
+    occupancy = device.endpoints[1].occupancy
+    assert occupancy._stuck_check_handle is None
+
+    occupancy.motion_event()
+
+    delay = occupancy._stuck_check_handle.when() - loop.time()
+    assert delay <= STUCK_CHECK_INTERVAL_S
+
+
+async def test_silent_device_warns(occupancy, caplog):
+    """A device silent for longer than the timeout logs a warning."""
+    loop = asyncio.get_running_loop()
+
+    occupancy._last_communication = loop.time() - COMMUNICATION_TIMEOUT_S - 60
+    occupancy._check_stuck_state()
+
+    assert "NO COMMUNICATION" in caplog.text
+    assert occupancy._stuck_check_handle is not None
+
+
+async def test_cancel_timers(occupancy):
+    """_cancel_timers cancels all scheduled callbacks and nulls the handles."""
     occupancy.motion_event()
-    assert occupancy._timer_handle is not None
+    handles = (occupancy._timer_handle, occupancy._stuck_check_handle)
+    assert None not in handles
 
     occupancy._cancel_timers()
 
     assert occupancy._timer_handle is None
     assert occupancy._stuck_check_handle is None
-    assert occupancy._init_clear_handle is None
+    assert all(handle.cancelled() for handle in handles)
+
+
+async def test_deadline_check_after_cancel_is_noop(occupancy, listener):
+    """A deadline callback that runs after _cancel_timers does nothing."""
+    occupancy.motion_event()
+    occupancy._cancel_timers()
+
+    occupancy._check_deadline()
+
+    assert list(listener.attribute_updates) == [(0x0000, 1)]
+    assert occupancy._timer_handle is None
+
+
+async def test_dropped_device_not_kept_alive_by_timers(
+    zigpy_device_from_quirk, virtual_clock
+):
+    """Queued timers do not keep a dropped device alive and fire as no-ops."""
+    device = zigpy_device_from_quirk(BoschRFDLZBMS)
+    occupancy = device.endpoints[1].occupancy
+    occupancy.motion_event()
+    ref = weakref.ref(occupancy)
+
+    # The device graph is cyclic, so only the cyclic collector reclaims it
+    del device, occupancy
+    gc.collect()
+    assert ref() is None
+
+    errors = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: errors.append(context)
+    )
+    await virtual_clock.advance(STUCK_CHECK_INTERVAL_S)
+    assert not errors